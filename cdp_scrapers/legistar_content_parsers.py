@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Optional, List
 from urllib.parse import unquote
 from urllib.request import urlopen
@@ -176,7 +176,13 @@ def _parse_format_4(client: str, soup: BeautifulSoup) -> Optional[List[ContentUR
         return [ContentURIs(ref_tag.get("HREF"))] if ref_tag is not None else None
 
 
+# tags looked at by all_parsers.
+# the video web page is parsed with only these tags (and their children).
+# update if a parser starts looking for some other tag.
+video_page_strainer = SoupStrainer(["script", "div", "video", "meta"])
+
 # TODO: do dynamically using inspect or something similar
+# NOTE: legistar_utils moves the most recently matched parser to the front
 all_parsers: List[LegistarContentParser] = [
     _parse_format_1,
     _parse_format_2,
@@ -1,19 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
 import enum
+import functools
 import logging
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from copy import deepcopy
 from datetime import datetime, timedelta
 from json import JSONDecodeError
-from typing import Any, Dict, List, NamedTuple, Optional, Set
-from urllib.error import HTTPError, URLError
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.error import URLError
 from urllib.parse import quote_plus
-from urllib.request import urlopen
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from cdp_backend.database.constants import (
     EventMinutesItemDecision,
     MatterStatusDecision,
@@ -31,15 +45,20 @@ from cdp_backend.pipeline.ingestion_models import (
     SupportingFile,
     Vote,
 )
+from requests.adapters import HTTPAdapter, Retry
 
+from .legistar_content_parsers import all_parsers, video_page_strainer
 from .scraper_utils import (
     IngestionModelScraper,
+    json_loads,
     reduced_list,
     sanitize_roles,
     str_simplified,
 )
 from .types import ContentURIs, LegistarContentParser, ScraperStaticData
-from .legistar_content_parsers import all_parsers
+
+if TYPE_CHECKING:
+    import aiohttp
 
 ###############################################################################
 
@@ -109,13 +128,236 @@ LEGISTAR_EV_EXT_ID = "EventId"
 LEGISTAR_EV_BODY = "EventBodyInfo"
 
 LEGISTAR_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# <a id="ctl00_ContentPlaceHolder1_hypVideo" ...> on legistar meeting detail page
+_HYPVIDEO_ID_RE = re.compile(r"ct\S*_ContentPlaceHolder\S*_hypVideo")
+
+# max number of concurrent requests to legistar api
+LEGISTAR_MAX_WORKERS = 32
+# seconds to wait for legistar web pages, e.g. the meeting detail page
+LEGISTAR_PAGE_TIMEOUT = 10
+# get EventItems with their attachments in the events response itself.
+# votes are not a legistar EventItem property and are always queried per item.
+# not all legistar deployments support $expand to this depth.
+LEGISTAR_EV_EXPAND = "$expand=EventItems($expand=EventItemMatterAttachments)"
+# max number of ids in one $filter=...+or+... query to keep the URL reasonable
+LEGISTAR_FILTER_BATCH_SIZE = 50
 ###############################################################################
 
 
-known_legistar_persons: Dict[int, Dict[str, Any]] = {}
-known_legistar_bodies: Dict[int, Dict[str, Any]] = {}
+def _mount_legistar_adapters(session: requests.Session) -> requests.Session:
+    """
+    Size session's connection pools for LEGISTAR_MAX_WORKERS concurrent requests
+    and retry on transient server errors
+    """
+    for prefix in ("http://", "https://"):
+        session.mount(
+            prefix,
+            HTTPAdapter(
+                pool_connections=LEGISTAR_MAX_WORKERS,
+                pool_maxsize=LEGISTAR_MAX_WORKERS,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    # return the last error response instead of raising RetryError
+                    # so callers can keep checking status_code
+                    raise_on_status=False,
+                ),
+            ),
+        )
+    return session
+
+
+# shared by all threads so connections to legistar are reused
+legistar_session: requests.Session = _mount_legistar_adapters(requests.Session())
+
+
+def enable_legistar_http_cache(
+    cache_name: str = "legistar_cache",
+    expire_after: timedelta = timedelta(days=7),
+    urls_expire_after: Optional[Dict[str, timedelta]] = None,
+) -> None:
+    """
+    Persist legistar api responses on disk so that repeated scrapes
+    for the same timespan mostly read from the local cache
+    instead of querying legistar again.
+
+    Parameters
+    ----------
+    cache_name: str, default="legistar_cache"
+        Path to the sqlite cache database file, without the ".sqlite" extension
+    expire_after: timedelta, default=7 days
+        How long to keep responses from legistar
+    urls_expire_after: Optional[Dict[str, timedelta]]
+        Glob URL pattern to how long to keep matching responses.
+        Default: Persons and Bodies are kept for 30 days.
+        Everything else, e.g. Events, EventItems, Votes, OfficeRecords,
+        is kept for expire_after.
+
+    Notes
+    -----
+    Requires requests-cache; pip install cdp-scrapers[cache]
+
+    Responses are revalidated with the server per Cache-Control and ETag headers.
+    Stale responses are used if legistar returns an error.
+    """
+    from requests_cache import CachedSession
+
+    global legistar_session
+
+    if urls_expire_after is None:
+        urls_expire_after = {
+            # first matching pattern is used.
+            # a person's roles change more often than the person's own info.
+            # events, items and votes for recent meetings change after the meeting
+            # so they are kept for expire_after
+            "*/OfficeRecords": expire_after,
+            "*/Persons/*": timedelta(days=30),
+            "*/Bodies/*": timedelta(days=30),
+        }
+
+    legistar_session = _mount_legistar_adapters(
+        CachedSession(
+            cache_name,
+            backend="sqlite",
+            expire_after=expire_after,
+            urls_expire_after=urls_expire_after,
+            cache_control=True,
+            stale_if_error=True,
+        )
+    )
+    log.debug(f"Caching legistar api responses in {cache_name}")
+
+
+def _response_json(response: requests.Response) -> Any:
+    """
+    response.json() but faster with orjson if available
+    """
+    return json_loads(response.content)
+
+
 # video web page parser type per municipality
 video_page_parser: Dict[str, LegistarContentParser] = {}
+# guard all_parsers reordering against concurrent get_legistar_content_uris() calls
+all_parsers_lock = threading.Lock()
+
+# max number of persons, bodies remembered by get_legistar_[person | body]()
+LEGISTAR_CACHE_SIZE = 4096
+
+# legistar Persons, without OfficeRecords, from prefetch_legistar_persons()
+# keyed by (client, PersonId). consumed by get_legistar_person(use_cache=True)
+prefetched_legistar_persons: Dict[Tuple[str, int], Dict[str, Any]] = {}
+prefetched_legistar_persons_lock = threading.Lock()
+
+# (client, query) for the $expand, batched $filter queries a municipality rejected.
+# these are not tried again; the per-event/per-id queries are used instead.
+# query is one of LEGISTAR_EV_EXPAND, "Matters?$filter", "Persons?$filter"
+unsupported_legistar_queries: Set[Tuple[str, str]] = set()
+
+
+def _get_legistar_list(client: str, query: str, url: str) -> Optional[List[Any]]:
+    """
+    GET url for an optional $expand or batched $filter query
+    and return the JSON list response. None if the request fails.
+    (client, query) is added to unsupported_legistar_queries
+    only if legistar rejects the query, not for errors that may be temporary.
+    """
+    try:
+        response = legistar_session.get(url)
+    except requests.exceptions.RequestException as e:
+        log.debug(f"{url}: {str(e)}")
+        return None
+
+    if response.status_code == 200:
+        try:
+            result = _response_json(response)
+        except ValueError:
+            result = None
+        if isinstance(result, list):
+            return result
+    elif response.status_code in (408, 429) or not (
+        400 <= response.status_code < 500 or response.status_code == 501
+    ):
+        # e.g. timeout, rate limit, 503 even after retries
+        log.debug(f"{url}: {response.status_code}")
+        return None
+
+    log.info(f"{client} does not support {query} queries; not trying them again")
+    unsupported_legistar_queries.add((client, query))
+    return None
+
+
+@functools.lru_cache(maxsize=LEGISTAR_CACHE_SIZE)
+def _fetch_legistar_body(client: str, body_id: int) -> Optional[Dict[str, Any]]:
+    """
+    GET a single legistar body. See get_legistar_body().
+    """
+    body_request_format = LEGISTAR_BODY_BASE + "/{body_id}"
+    response = legistar_session.get(
+        body_request_format.format(
+            client=client,
+            body_id=body_id,
+        )
+    )
+
+    if response.status_code == 200:
+        return _response_json(response)
+    return None
+
+
+@functools.lru_cache(maxsize=LEGISTAR_CACHE_SIZE)
+def _fetch_legistar_person(
+    client: str, person_id: int, use_cache: bool
+) -> Optional[Dict[str, Any]]:
+    """
+    GET a single legistar person and the person's OfficeRecords.
+    See get_legistar_person().
+    """
+    person_request_format = LEGISTAR_PERSON_BASE + "/{person_id}"
+
+    person = None
+    if use_cache:
+        # already have this person from a batched query.
+        # See Also
+        # prefetch_legistar_persons()
+        with prefetched_legistar_persons_lock:
+            person = prefetched_legistar_persons.pop((client, person_id), None)
+
+    if person is None:
+        response = legistar_session.get(
+            person_request_format.format(
+                client=client,
+                person_id=person_id,
+            )
+        )
+
+        if response.status_code != 200:
+            return None
+
+        person = _response_json(response)
+
+    # all known OfficeRecords (roles) for this person
+    response = legistar_session.get(
+        (person_request_format + "/OfficeRecords").format(
+            client=client,
+            person_id=person_id,
+        )
+    )
+
+    if response.status_code != 200:
+        person[LEGISTAR_PERSON_ROLES] = None
+        return person
+
+    office_records: List[Dict[str, Any]] = _response_json(response)
+    for record in office_records:
+        # body for this role
+        record[LEGISTAR_ROLE_BODY] = get_legistar_body(
+            client=client, body_id=record["OfficeRecordBodyId"], use_cache=use_cache
+        )
+
+    person[LEGISTAR_PERSON_ROLES] = office_records
+    return person
 
 
 def get_legistar_body(
@@ -142,33 +384,11 @@ def get_legistar_body(
 
     Notes
     -----
-    known_legistar_bodies cache is cleared for every LegistarScraper.get_events() call
+    The cache is cleared for every LegistarScraper.get_events() call
     """
-    global known_legistar_bodies
-
-    if use_cache:
-        try:
-            return known_legistar_bodies[body_id]
-        except KeyError:
-            # new body
-            pass
-
-    body_request_format = LEGISTAR_BODY_BASE + "/{body_id}"
-    response = requests.get(
-        body_request_format.format(
-            client=client,
-            body_id=body_id,
-        )
-    )
-
-    if response.status_code == 200:
-        body = response.json()
-    else:
-        body = None
-
     if use_cache:
-        known_legistar_bodies[body_id] = body
-    return body
+        return _fetch_legistar_body(client, body_id)
+    return _fetch_legistar_body.__wrapped__(client, body_id)
 
 
 def get_legistar_person(
@@ -195,57 +415,446 @@ def get_legistar_person(
 
     Notes
     -----
-    known_legistar_persons cache is cleared for every LegistarScraper.get_events() call
+    The cache is cleared for every LegistarScraper.get_events() call
     """
-    global known_legistar_persons
-
     if use_cache:
-        try:
-            return known_legistar_persons[person_id]
-        except KeyError:
-            # new person
-            pass
+        return _fetch_legistar_person(client, person_id, True)
+    return _fetch_legistar_person.__wrapped__(client, person_id, False)
 
-    person_request_format = LEGISTAR_PERSON_BASE + "/{person_id}"
-    response = requests.get(
-        person_request_format.format(
-            client=client,
-            person_id=person_id,
-        )
+
+def prefetch_legistar_persons(client: str, person_ids: Iterable[int]) -> None:
+    """
+    Query many legistar persons in as few requests as possible
+    so that get_legistar_person(use_cache=True) for these persons
+    only needs to query the persons' OfficeRecords.
+
+    Parameters
+    ----------
+    client: str
+        Which legistar client to target. Ex: "seattle"
+    person_ids: Iterable[int]
+        Unique IDs for persons in the legistar municipality
+
+    See Also
+    --------
+    get_legistar_person()
+    """
+    person_request_format = LEGISTAR_PERSON_BASE + "?$filter={filter}"
+    person_ids = sorted(
+        {person_id for person_id in person_ids if isinstance(person_id, int)}
     )
 
-    if response.status_code != 200:
-        if use_cache:
-            known_legistar_persons[person_id] = None
+    for i in range(0, len(person_ids), LEGISTAR_FILTER_BATCH_SIZE):
+        if (client, "Persons?$filter") in unsupported_legistar_queries:
+            # get_legistar_person() will query these persons one by one
+            return
+
+        persons = _get_legistar_list(
+            client,
+            "Persons?$filter",
+            person_request_format.format(
+                client=client,
+                filter="+or+".join(
+                    f"PersonId+eq+{person_id}"
+                    for person_id in person_ids[i : i + LEGISTAR_FILTER_BATCH_SIZE]
+                ),
+            ),
+        )
+        if persons is None:
+            # get_legistar_person() will query these persons one by one
+            continue
+        with prefetched_legistar_persons_lock:
+            for person in persons:
+                prefetched_legistar_persons[
+                    (client, person[LEGISTAR_PERSON_EXT_ID])
+                ] = person
+
+
+def get_legistar_matter_sponsors(
+    client: str,
+    matter_id: Any,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return MatterSponsors for a single legistar matter in JSON.
+
+    Parameters
+    ----------
+    client: str
+        Which legistar client to target. Ex: "seattle"
+    matter_id: Any
+        Unique ID for this matter in the legistar municipality,
+        e.g. EventItemMatterId
+
+    Returns
+    -------
+    sponsors: Optional[List[Dict[str, Any]]]
+        legistar API MatterSponsors. None if matter_id is not a valid ID.
+
+    Notes
+    -----
+    MatterSponsor just has a reference to a Person.
+    SponsorPersonInfo is attached by get_legistar_events_for_timespan()
+    """
+    if not isinstance(matter_id, int) or matter_id < 0:
         return None
 
-    person = response.json()
+    sponsor_request_format = LEGISTAR_MATTER_BASE + "/{matter_id}/Sponsors"
+    return _response_json(
+        legistar_session.get(
+            sponsor_request_format.format(
+                client=client,
+                matter_id=matter_id,
+            )
+        )
+    )
 
-    # all known OfficeRecords (roles) for this person
-    response = requests.get(
-        (person_request_format + "/OfficeRecords").format(
-            client=client,
-            person_id=person_id,
+
+def get_legistar_matters_sponsors(
+    client: str,
+    matter_ids: Iterable[int],
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Return MatterSponsors for many legistar matters
+    in as few requests as possible.
+
+    Parameters
+    ----------
+    client: str
+        Which legistar client to target. Ex: "seattle"
+    matter_ids: Iterable[int]
+        Unique IDs for matters in the legistar municipality
+
+    Returns
+    -------
+    sponsors: Dict[int, List[Dict[str, Any]]]
+        legistar API MatterSponsors per MatterId.
+        Matters missing from the legistar response are missing here too.
+
+    See Also
+    --------
+    get_legistar_matter_sponsors()
+    """
+    matter_request_format = (
+        LEGISTAR_MATTER_BASE + "?$filter={filter}&$expand=MatterSponsors"
+    )
+    matter_ids = sorted(set(matter_ids))
+    sponsors: Dict[int, List[Dict[str, Any]]] = {}
+
+    for i in range(0, len(matter_ids), LEGISTAR_FILTER_BATCH_SIZE):
+        if (client, "Matters?$filter") in unsupported_legistar_queries:
+            break
+
+        matters = _get_legistar_list(
+            client,
+            "Matters?$filter",
+            matter_request_format.format(
+                client=client,
+                filter="+or+".join(
+                    f"MatterId+eq+{matter_id}"
+                    for matter_id in matter_ids[i : i + LEGISTAR_FILTER_BATCH_SIZE]
+                ),
+            ),
         )
+        if matters is None:
+            continue
+        for matter in matters:
+            if isinstance(matter.get("MatterSponsors"), list):
+                sponsors[matter["MatterId"]] = matter["MatterSponsors"]
+
+    return sponsors
+
+
+def _has_event_item_details(event: Dict[str, Any]) -> bool:
+    """
+    Did the events query already give us this event's EventItems with attachments
+    """
+    return isinstance(event.get(LEGISTAR_EV_ITEMS), list) and all(
+        LEGISTAR_EV_ATTACHMENTS in event_item for event_item in event[LEGISTAR_EV_ITEMS]
     )
 
-    if response.status_code != 200:
-        person[LEGISTAR_PERSON_ROLES] = None
-        if use_cache:
-            known_legistar_persons[person_id] = person
-        return person
 
-    office_records: List[Dict[str, Any]] = response.json()
-    for record in office_records:
-        # body for this role
-        record[LEGISTAR_ROLE_BODY] = get_legistar_body(
-            client=client, body_id=record["OfficeRecordBodyId"], use_cache=use_cache
+def _when_all(futures: List[Future], callback: Callable[[], None]) -> None:
+    """
+    Call callback once all futures are done, right away if there are no futures.
+    Does not block; callback runs in the thread that finished the last future.
+    """
+    if not futures:
+        callback()
+        return
+
+    remaining = len(futures)
+    lock = threading.Lock()
+
+    def _done(_: Future) -> None:
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            is_last = remaining == 0
+        if is_last:
+            callback()
+
+    for future in futures:
+        future.add_done_callback(_done)
+
+
+class LegistarFetcher:
+    """
+    Query everything a legistar event refers to (items, votes, matter sponsors,
+    persons, body) on a shared thread pool.
+
+    Each request is submitted as soon as the request it depends on completes,
+    so requests for one event overlap with requests for other events
+    instead of waiting for every event to reach the same step.
+
+    Persons and bodies are queried once per LegistarFetcher;
+    events referring to a person or body already being queried
+    wait for that query instead of querying again.
+
+    Parameters
+    ----------
+    client: str
+        Which legistar client to target. Ex: "seattle"
+    max_workers: int, default=LEGISTAR_MAX_WORKERS
+        Max number of concurrent requests to legistar
+
+    Examples
+    --------
+    with LegistarFetcher("seattle") as fetcher:
+        futures = [fetcher.submit_event(event) for event in events]
+        wait(futures)
+    """
+
+    def __init__(self, client: str, max_workers: int = LEGISTAR_MAX_WORKERS):
+        self.client = client
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # single-flight queries per PersonId, BodyId
+        self._persons: Dict[int, Future] = {}
+        self._bodies: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "LegistarFetcher":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.executor.shutdown(wait=True)
+
+    def _get(self, url: str) -> Any:
+        return _response_json(legistar_session.get(url))
+
+    def _then(self, future: Future, func: Callable, *args: Any) -> Future:
+        """
+        Future for func(*args) submitted to the executor once future is done.
+        Fails without calling func if future fails.
+        """
+        chained: Future = Future()
+
+        def _copy_result(done: Future) -> None:
+            if done.exception() is not None:
+                chained.set_exception(done.exception())
+            else:
+                chained.set_result(done.result())
+
+        def _submit(done: Future) -> None:
+            if done.exception() is not None:
+                chained.set_exception(done.exception())
+            else:
+                self.executor.submit(func, *args).add_done_callback(_copy_result)
+
+        future.add_done_callback(_submit)
+        return chained
+
+    def get_body(self, body_id: int) -> Future:
+        """
+        Future for get_legistar_body(body_id)
+        """
+        with self._lock:
+            if body_id not in self._bodies:
+                self._bodies[body_id] = self.executor.submit(
+                    get_legistar_body,
+                    client=self.client,
+                    body_id=body_id,
+                    use_cache=True,
+                )
+            return self._bodies[body_id]
+
+    def get_persons(self, person_ids: Iterable[int]) -> Dict[int, Future]:
+        """
+        Future for get_legistar_person() per person id.
+        Persons not already being queried are first queried together
+        with prefetch_legistar_persons().
+        """
+        person_ids = set(person_ids)
+        with self._lock:
+            new_person_ids = person_ids - self._persons.keys()
+            if new_person_ids:
+                prefetch = self.executor.submit(
+                    prefetch_legistar_persons, self.client, new_person_ids
+                )
+                for person_id in new_person_ids:
+                    self._persons[person_id] = self._then(
+                        prefetch, get_legistar_person, self.client, person_id, True
+                    )
+            return {person_id: self._persons[person_id] for person_id in person_ids}
+
+    def get_matters_sponsors(self, matter_ids: Iterable[int]) -> Future:
+        """
+        Future for MatterSponsors per MatterId.
+        Matters are queried together, then one by one
+        for any matter the batched query did not give us.
+        """
+        matter_ids = set(matter_ids)
+        result: Future = Future()
+
+        def _on_batch(batch: Future) -> None:
+            try:
+                sponsors = batch.result()
+                unbatched = {
+                    matter_id: self.executor.submit(
+                        get_legistar_matter_sponsors,
+                        client=self.client,
+                        matter_id=matter_id,
+                    )
+                    for matter_id in matter_ids - sponsors.keys()
+                }
+            except BaseException as e:
+                result.set_exception(e)
+                return
+
+            def _on_unbatched() -> None:
+                try:
+                    for matter_id, future in unbatched.items():
+                        sponsors[matter_id] = future.result()
+                except BaseException as e:
+                    result.set_exception(e)
+                    return
+                result.set_result(sponsors)
+
+            _when_all(list(unbatched.values()), _on_unbatched)
+
+        self.executor.submit(
+            get_legistar_matters_sponsors, self.client, matter_ids
+        ).add_done_callback(_on_batch)
+        return result
+
+    def submit_event(self, event: Dict[str, Any]) -> Future:
+        """
+        Query and attach everything event refers to.
+
+        Parameters
+        ----------
+        event: Dict[str, Any]
+            legistar API event, from the events query.
+            EventItems, votes already in event are not queried again.
+
+        Returns
+        -------
+        future: Future
+            Resolves to event once all of its information is attached
+        """
+        item_request_format = (
+            LEGISTAR_EVENT_BASE
+            + "/{event_id}/EventItems?AgendaNote=1&MinutesNote=1&Attachments=1"
         )
+        vote_request_format = LEGISTAR_VOTE_BASE + "/{event_item_id}/Votes"
 
-    person[LEGISTAR_PERSON_ROLES] = office_records
-    if use_cache:
-        known_legistar_persons[person_id] = person
-    return person
+        result: Future = Future()
+
+        def _step(func: Callable[..., None]) -> Callable[..., None]:
+            # route errors from any step to this event's future
+            @functools.wraps(func)
+            def _wrapper(*args: Any) -> None:
+                try:
+                    func(*args)
+                except BaseException as e:
+                    result.set_exception(e)
+
+            return _wrapper
+
+        # info for the body responsible for the event
+        body = self.get_body(event["EventBodyId"])
+
+        @_step
+        def _on_items(items: Future) -> None:
+            # Attach the Event Items to the event
+            event[LEGISTAR_EV_ITEMS] = items.result()
+
+            # Get vote information
+            votes = {
+                event_item["EventItemId"]: self.executor.submit(
+                    self._get,
+                    vote_request_format.format(
+                        client=self.client,
+                        event_item_id=event_item["EventItemId"],
+                    ),
+                )
+                for event_item in event[LEGISTAR_EV_ITEMS]
+                if not isinstance(event_item.get(LEGISTAR_EV_VOTES), list)
+            }
+            # the matters' sponsors
+            sponsors = self.get_matters_sponsors(
+                event_item["EventItemMatterId"]
+                for event_item in event[LEGISTAR_EV_ITEMS]
+                if isinstance(event_item["EventItemMatterId"], int)
+                and event_item["EventItemMatterId"] >= 0
+            )
+            _when_all(
+                [*votes.values(), sponsors], _step(lambda: _on_details(votes, sponsors))
+            )
+
+        def _on_details(votes: Dict[int, Future], sponsors: Future) -> None:
+            matter_sponsors = sponsors.result()
+            for event_item in event[LEGISTAR_EV_ITEMS]:
+                if event_item["EventItemId"] in votes:
+                    event_item[LEGISTAR_EV_VOTES] = votes[
+                        event_item["EventItemId"]
+                    ].result()
+                event_item[LEGISTAR_MATTER_SPONSORS] = matter_sponsors.get(
+                    event_item["EventItemMatterId"]
+                )
+
+            # Get person information
+            # legistar Vote and MatterSponsor just have a reference to a Person
+            # so further obtain the actual Person information.
+            persons = self.get_persons(
+                {
+                    vote_info["VotePersonId"]
+                    for event_item in event[LEGISTAR_EV_ITEMS]
+                    for vote_info in event_item[LEGISTAR_EV_VOTES]
+                }
+                | {
+                    sponsor["MatterSponsorNameId"]
+                    for event_item in event[LEGISTAR_EV_ITEMS]
+                    for sponsor in event_item[LEGISTAR_MATTER_SPONSORS] or []
+                }
+            )
+            _when_all([*persons.values(), body], _step(lambda: _on_persons(persons)))
+
+        def _on_persons(persons: Dict[int, Future]) -> None:
+            for event_item in event[LEGISTAR_EV_ITEMS]:
+                for vote_info in event_item[LEGISTAR_EV_VOTES]:
+                    vote_info[LEGISTAR_VOTE_PERSONS] = persons[
+                        vote_info["VotePersonId"]
+                    ].result()
+                for sponsor in event_item[LEGISTAR_MATTER_SPONSORS] or []:
+                    sponsor[LEGISTAR_SPONSOR_PERSON] = persons[
+                        sponsor["MatterSponsorNameId"]
+                    ].result()
+            event[LEGISTAR_EV_BODY] = body.result()
+            result.set_result(event)
+
+        if _has_event_item_details(event):
+            # the $expand-ed events query already gave us the EventItems
+            items: Future = Future()
+            items.set_result(event[LEGISTAR_EV_ITEMS])
+        else:
+            items = self.executor.submit(
+                self._get,
+                item_request_format.format(
+                    client=self.client, event_id=event["EventId"]
+                ),
+            )
+        items.add_done_callback(_on_items)
+        return result
 
 
 def get_legistar_events_for_timespan(
@@ -290,91 +899,45 @@ def get_legistar_events_for_timespan(
     # during the lifetime of this single call is miniscule.
     # use a cache to prevent 10s-100s of web requests
     # for the same person/body
-    global known_legistar_persons, known_legistar_bodies
     # See Also
     # get_legistar_person()
-    known_legistar_persons.clear()
+    _fetch_legistar_person.cache_clear()
+    with prefetched_legistar_persons_lock:
+        prefetched_legistar_persons.clear()
     # See Also
     # get_legistar_body()
-    known_legistar_bodies.clear()
+    _fetch_legistar_body.cache_clear()
 
     # Get response from formatted request
     log.debug(f"Querying Legistar for events between: {begin} - {end}")
-    response = requests.get(
-        request_format.format(
-            client=client,
-            begin=filter_datetime_format.format(
-                op="ge",
-                dt=str(begin).replace(" ", "T"),
-            ),
-            end=filter_datetime_format.format(
-                op="lt",
-                dt=str(end).replace(" ", "T"),
-            ),
-        )
-    ).json()
-
-    # Get all event items for each event
-    item_request_format = (
-        LEGISTAR_EVENT_BASE
-        + "/{event_id}/EventItems?AgendaNote=1&MinutesNote=1&Attachments=1"
+    events_request = request_format.format(
+        client=client,
+        begin=filter_datetime_format.format(
+            op="ge",
+            dt=begin.isoformat(),
+        ),
+        end=filter_datetime_format.format(
+            op="lt",
+            dt=end.isoformat(),
+        ),
     )
-    for event in response:
-        # Attach the Event Items to the event
-        event["EventItems"] = requests.get(
-            item_request_format.format(client=client, event_id=event["EventId"])
-        ).json()
-
-        # Attach info for the body responsible for this event
-        event[LEGISTAR_EV_BODY] = get_legistar_body(
-            client=client, body_id=event["EventBodyId"], use_cache=True
+    response = None
+    if (client, LEGISTAR_EV_EXPAND) not in unsupported_legistar_queries:
+        response = _get_legistar_list(
+            client, LEGISTAR_EV_EXPAND, f"{events_request}&{LEGISTAR_EV_EXPAND}"
         )
+    if response is None:
+        response = _response_json(legistar_session.get(events_request))
 
-        # Get vote information
-        for event_item in event["EventItems"]:
-            vote_request_format = LEGISTAR_VOTE_BASE + "/{event_item_id}/Votes"
-            event_item["EventItemVoteInfo"] = requests.get(
-                vote_request_format.format(
-                    client=client,
-                    event_item_id=event_item["EventItemId"],
-                )
-            ).json()
-
-            # Get person information
-            for vote_info in event_item["EventItemVoteInfo"]:
-                vote_info["PersonInfo"] = get_legistar_person(
-                    client=client,
-                    person_id=vote_info["VotePersonId"],
-                    use_cache=True,
-                )
-
-            if (
-                not isinstance(event_item["EventItemMatterId"], int)
-                or event_item["EventItemMatterId"] < 0
-            ):
-                event_item[LEGISTAR_MATTER_SPONSORS] = None
-            else:
-                # this matter's sponsors
-                sponsor_request_format = (
-                    LEGISTAR_MATTER_BASE + "/{event_item_matter_id}/Sponsors"
-                )
-                sponsors = requests.get(
-                    sponsor_request_format.format(
-                        client=client,
-                        event_item_matter_id=event_item["EventItemMatterId"],
-                    )
-                ).json()
-
-                # legistar MatterSponsor just has a reference to a Person
-                # so further obtain the actual Person information
-                for sponsor in sponsors:
-                    sponsor[LEGISTAR_SPONSOR_PERSON] = get_legistar_person(
-                        client=client,
-                        person_id=sponsor["MatterSponsorNameId"],
-                        use_cache=True,
-                    )
-
-                event_item[LEGISTAR_MATTER_SPONSORS] = sponsors
+    # query each event's details as soon as the details they depend on arrive.
+    # See Also
+    # LegistarFetcher
+    with LegistarFetcher(client) as fetcher:
+        futures = [fetcher.submit_event(event) for event in response]
+        wait(futures)
+        # re-raise the first error, if any, from querying the events' details
+        for future in futures:
+            future.result()
 
     log.debug(f"Collected {len(response)} Legistar events")
     return response
@@ -395,38 +958,11 @@ class ContentUriScrapeResult(NamedTuple):
     uris: Optional[List[ContentURIs]] = None
 
 
-def get_legistar_content_uris(client: str, legistar_ev: Dict) -> ContentUriScrapeResult:
+def _get_event_video_path(legistar_ev: Dict) -> Optional[ContentUriScrapeResult]:
     """
-    Return URLs for videos and captions from a Legistar/Granicus-hosted video web page
-
-    Parameters
-    ----------
-    client: str
-        Which legistar client to target. Ex: "seattle"
-    legistar_ev: Dict
-        Data for one Legistar Event.
-
-    Returns
-    -------
-    ContentUriScrapeResult
-        status: ContentUriScrapeResult.Status
-            Status code describing the scraping process. Use uris only if status is Ok
-        uris: Optional[List[ContentURIs]]
-            URIs for video and optional caption
-
-    Raises
-    ------
-    NotImplementedError
-        Means the content structure of the web page hosting session video has changed.
-        We need explicit review and update the scraping code.
-
-    See Also
-    --------
-    LegistarScraper.get_content_uris()
-    cdp_scrapers.legistar_content_parsers
+    Scrape result for legistar_ev without accessing any web page, if possible.
+    None if need to look at the legistar web pages for this event.
     """
-    global video_page_parser
-
     # prefer video file path in legistar Event.EventVideoPath
     if legistar_ev[LEGISTAR_SESSION_VIDEO_URI]:
         return (
@@ -440,18 +976,22 @@ def get_legistar_content_uris(client: str, legistar_ev: Dict) -> ContentUriScrap
         )
     if not legistar_ev[LEGISTAR_EV_SITE_URL]:
         return (ContentUriScrapeResult.Status.UnrecognizedPatternError, None)
+    return None
 
-    try:
-        # a td tag with a certain id pattern.
-        # this is usually something like
-        # https://somewhere.legistar.com/MeetingDetail.aspx...
-        # that is a summary-like page for a meeting
-        with urlopen(legistar_ev[LEGISTAR_EV_SITE_URL]) as resp:
-            soup = BeautifulSoup(resp.read(), "html.parser")
 
-    except (URLError, HTTPError) as e:
-        log.debug(f"{legistar_ev[LEGISTAR_EV_SITE_URL]}: {str(e)}")
-        return (ContentUriScrapeResult.Status.ResourceAccessError, None)
+def _get_video_page_url(
+    client: str, meeting_page: bytes
+) -> Tuple[ContentUriScrapeResult.Status, Optional[str]]:
+    """
+    URL for the web PAGE containing the video, from legistar meeting detail page.
+    The URL is given only if the returned status is Ok.
+    """
+    # only want the one <a> tag below. don't build the rest of the page
+    soup = BeautifulSoup(
+        meeting_page,
+        "lxml",
+        parse_only=SoupStrainer("a", id=_HYPVIDEO_ID_RE),
+    )
 
     # this gets us the url for the web PAGE containing the video
     # video link is provided in the window.open()command inside onclick event
@@ -464,7 +1004,7 @@ def get_legistar_content_uris(client: str, legistar_ev: Dict) -> ContentUriScrap
     # href="#" style="color:Blue;font-family:Tahoma;font-size:10pt;">Video</a>
     extract_url = soup.find(
         "a",
-        id=re.compile(r"ct\S*_ContentPlaceHolder\S*_hypVideo"),
+        id=_HYPVIDEO_ID_RE,
         class_="videolink",
     )
     if extract_url is None:
@@ -475,44 +1015,255 @@ def get_legistar_content_uris(client: str, legistar_ev: Dict) -> ContentUriScrap
 
     # NOTE: after this point, failing to scrape video url should raise an exception.
     # we need to be alerted that we probabaly have a new web page structure.
+    onclick = extract_url["onclick"]
+    # window.open('Video.aspx?...','video'); -> Video.aspx?...
+    _, _, video_page_path = onclick.partition("'")
+    video_page_path, _, _ = video_page_path.partition("'")
+    if not video_page_path:
+        raise NotImplementedError(
+            "get_legistar_content_uris() needs attention. "
+            f"Unrecognized onclick for video web page: {onclick}"
+        )
+    return (
+        ContentUriScrapeResult.Status.Ok,
+        f"https://{client}.legistar.com/{video_page_path}",
+    )
 
-    extract_url = extract_url["onclick"]
-    start = extract_url.find("'") + len("'")
-    end = extract_url.find("',")
-    video_page_url = f"https://{client}.legistar.com/{extract_url[start:end]}"
 
-    log.debug(f"{legistar_ev[LEGISTAR_EV_SITE_URL]} -> {video_page_url}")
+def _parse_video_page(
+    client: str, video_page_url: str, video_page: bytes
+) -> List[ContentURIs]:
+    """
+    URIs for video and optional caption from the web page containing the video.
 
-    try:
-        with urlopen(video_page_url) as resp:
-            # now load the page to get the actual video url
-            soup = BeautifulSoup(resp.read(), "html.parser")
+    Raises
+    ------
+    NotImplementedError
+        None of all_parsers recognize the web page.
+    """
+    global video_page_parser
 
-            if client in video_page_parser:
-                # we alrady know which format parser to call
-                uris = video_page_parser[client](client, soup)
-            else:
-                for parser in all_parsers:
-                    uris = parser(client, soup)
-                    if uris is not None:
-                        # remember so we just call this from here on
-                        video_page_parser[client] = parser
-                        log.debug(f"{parser} for {client}")
-                        break
-                else:
-                    uris = None
-    except HTTPError as e:
-        log.debug(f"Error opening {video_page_url}:\n{str(e)}")
-        return (ContentUriScrapeResult.Status.ResourceAccessError, None)
+    # now load the page to get the actual video url
+    soup = BeautifulSoup(video_page, "lxml", parse_only=video_page_strainer)
+
+    if client in video_page_parser:
+        # we alrady know which format parser to call
+        uris = video_page_parser[client](client, soup)
+    else:
+        with all_parsers_lock:
+            parsers = list(all_parsers)
+        for parser in parsers:
+            uris = parser(client, soup)
+            if uris is not None:
+                # remember so we just call this from here on
+                video_page_parser[client] = parser
+                log.debug(f"{parser} for {client}")
+                # most recently matched parser is tried first for the next client
+                with all_parsers_lock:
+                    all_parsers.remove(parser)
+                    all_parsers.insert(0, parser)
+                break
+        else:
+            uris = None
 
     if uris is None:
         raise NotImplementedError(
             "get_legistar_content_uris() needs attention. "
             f"Unrecognized video web page HTML structure: {video_page_url}"
         )
+    return uris
+
+
+def get_legistar_content_uris(client: str, legistar_ev: Dict) -> ContentUriScrapeResult:
+    """
+    Return URLs for videos and captions from a Legistar/Granicus-hosted video web page
+
+    Parameters
+    ----------
+    client: str
+        Which legistar client to target. Ex: "seattle"
+    legistar_ev: Dict
+        Data for one Legistar Event.
+
+    Returns
+    -------
+    ContentUriScrapeResult
+        status: ContentUriScrapeResult.Status
+            Status code describing the scraping process. Use uris only if status is Ok
+        uris: Optional[List[ContentURIs]]
+            URIs for video and optional caption
+
+    Raises
+    ------
+    NotImplementedError
+        Means the content structure of the web page hosting session video has changed.
+        We need explicit review and update the scraping code.
+
+    See Also
+    --------
+    LegistarScraper.get_content_uris()
+    cdp_scrapers.legistar_content_parsers
+    get_legistar_content_uris_async()
+    """
+    result = _get_event_video_path(legistar_ev)
+    if result is not None:
+        return result
+
+    try:
+        # a td tag with a certain id pattern.
+        # this is usually something like
+        # https://somewhere.legistar.com/MeetingDetail.aspx...
+        # that is a summary-like page for a meeting
+        resp = legistar_session.get(
+            legistar_ev[LEGISTAR_EV_SITE_URL], timeout=LEGISTAR_PAGE_TIMEOUT
+        )
+        resp.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        log.debug(f"{legistar_ev[LEGISTAR_EV_SITE_URL]}: {str(e)}")
+        return (ContentUriScrapeResult.Status.ResourceAccessError, None)
+
+    status, video_page_url = _get_video_page_url(client, resp.content)
+    if status != ContentUriScrapeResult.Status.Ok:
+        return (status, None)
+
+    log.debug(f"{legistar_ev[LEGISTAR_EV_SITE_URL]} -> {video_page_url}")
+
+    try:
+        resp = legistar_session.get(video_page_url, timeout=LEGISTAR_PAGE_TIMEOUT)
+        resp.raise_for_status()
+        uris = _parse_video_page(client, video_page_url, resp.content)
+    # URLError, HTTPError from content parsers that make further requests themselves
+    except (requests.exceptions.RequestException, URLError) as e:
+        log.debug(f"Error opening {video_page_url}:\n{str(e)}")
+        return (ContentUriScrapeResult.Status.ResourceAccessError, None)
+
     return (ContentUriScrapeResult.Status.Ok, uris)
 
 
+async def get_legistar_content_uris_async(
+    session: "aiohttp.ClientSession", client: str, legistar_ev: Dict
+) -> ContentUriScrapeResult:
+    """
+    get_legistar_content_uris() using aiohttp so that
+    web pages for many events can be requested concurrently.
+
+    Parameters
+    ----------
+    session: aiohttp.ClientSession
+        Session used to request the legistar web pages.
+        Its timeout, e.g. aiohttp.ClientTimeout(total=LEGISTAR_PAGE_TIMEOUT),
+        bounds how long to wait for each page.
+    client: str
+        Which legistar client to target. Ex: "seattle"
+    legistar_ev: Dict
+        Data for one Legistar Event.
+
+    Returns
+    -------
+    ContentUriScrapeResult
+        See get_legistar_content_uris()
+
+    Raises
+    ------
+    NotImplementedError
+        See get_legistar_content_uris()
+
+    See Also
+    --------
+    get_legistar_content_uris()
+    scrape_all_content_uris()
+    """
+    import aiohttp
+
+    result = _get_event_video_path(legistar_ev)
+    if result is not None:
+        return result
+
+    try:
+        async with session.get(legistar_ev[LEGISTAR_EV_SITE_URL]) as resp:
+            resp.raise_for_status()
+            meeting_page = await resp.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log.debug(f"{legistar_ev[LEGISTAR_EV_SITE_URL]}: {str(e)}")
+        return (ContentUriScrapeResult.Status.ResourceAccessError, None)
+
+    status, video_page_url = _get_video_page_url(client, meeting_page)
+    if status != ContentUriScrapeResult.Status.Ok:
+        return (status, None)
+
+    log.debug(f"{legistar_ev[LEGISTAR_EV_SITE_URL]} -> {video_page_url}")
+
+    try:
+        async with session.get(video_page_url) as resp:
+            resp.raise_for_status()
+            video_page = await resp.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log.debug(f"Error opening {video_page_url}:\n{str(e)}")
+        return (ContentUriScrapeResult.Status.ResourceAccessError, None)
+
+    try:
+        # some parsers make further blocking requests.
+        # keep those off of the event loop
+        uris = await asyncio.get_running_loop().run_in_executor(
+            None, _parse_video_page, client, video_page_url, video_page
+        )
+    # URLError, HTTPError from content parsers that make further requests themselves
+    except URLError as e:
+        log.debug(f"Error opening {video_page_url}:\n{str(e)}")
+        return (ContentUriScrapeResult.Status.ResourceAccessError, None)
+
+    return (ContentUriScrapeResult.Status.Ok, uris)
+
+
+async def scrape_all_content_uris(
+    client: str, legistar_events: List[Dict]
+) -> List[ContentUriScrapeResult]:
+    """
+    get_legistar_content_uris() for all legistar_events concurrently.
+
+    Parameters
+    ----------
+    client: str
+        Which legistar client to target. Ex: "seattle"
+    legistar_events: List[Dict]
+        Legistar Events, e.g. from get_legistar_events_for_timespan()
+
+    Returns
+    -------
+    List[ContentUriScrapeResult]
+        Scrape result for legistar_events[i] in i-th position
+
+    Raises
+    ------
+    NotImplementedError
+        See get_legistar_content_uris()
+
+    Notes
+    -----
+    Requires aiohttp; pip install cdp-scrapers[async]
+
+    From synchronous code, use
+    asyncio.run(scrape_all_content_uris(client, legistar_events))
+
+    See Also
+    --------
+    get_legistar_content_uris_async()
+    """
+    import aiohttp
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32),
+        # same as get_legistar_content_uris()
+        timeout=aiohttp.ClientTimeout(total=LEGISTAR_PAGE_TIMEOUT),
+    ) as session:
+        return await asyncio.gather(
+            *(
+                get_legistar_content_uris_async(session, client, legistar_ev)
+                for legistar_ev in legistar_events
+            )
+        )
+
+
 class LegistarScraper(IngestionModelScraper):
     """
     Base class for transforming Legistar API data to CDP IngestionModel.
@@ -986,11 +1737,13 @@ class LegistarScraper(IngestionModelScraper):
                 try:
                     # query to get PersonId for the reference person we want to use
                     # in place of the input person
-                    response: List[Dict[str, Any]] = requests.get(
-                        request_format.format(
-                            client=self.client_name, name=quote_plus(name)
-                        ),
-                    ).json()
+                    response: List[Dict[str, Any]] = _response_json(
+                        legistar_session.get(
+                            request_format.format(
+                                client=self.client_name, name=quote_plus(name)
+                            ),
+                        )
+                    )
                 except JSONDecodeError:
                     response: List[Dict[str, Any]] = []
 
@@ -1574,9 +2327,11 @@ class LegistarScraper(IngestionModelScraper):
         """
         # simplest check, if the GET request works, it is a legistar municipality
         try:
-            resp = urlopen(f"http://webapi.legistar.com/v1/{self.client_name}/bodies")
-            return resp.status == 200
-        except URLError or HTTPError:
+            resp = legistar_session.get(
+                f"http://webapi.legistar.com/v1/{self.client_name}/bodies"
+            )
+            return resp.status_code == 200
+        except requests.exceptions.RequestException:
             return False
 
     def check_for_cdp_min_ingestion(self, check_days: int = 7) -> bool:
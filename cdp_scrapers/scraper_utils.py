@@ -1,13 +1,28 @@
-import json
+import functools
 import re
-from copy import deepcopy
-from datetime import datetime, timedelta
-from itertools import filterfalse, groupby
+import sys
+from collections import defaultdict
+from copy import copy
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from logging import getLogger
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, NamedTuple, Optional, Set
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
-import cleantext
+import ftfy
 import pytz
 from cdp_backend.database.constants import RoleTitle
 from cdp_backend.pipeline.ingestion_models import (
@@ -21,21 +36,50 @@ from cdp_backend.utils.constants_utils import get_all_class_attr_values
 
 from .types import ScraperStaticData
 
+try:
+    # much faster than the json standard library. pip install cdp-scrapers[speedups]
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 ###############################################################################
 
 log = getLogger(__name__)
 
 ###############################################################################
 
+# Role.title must be a RoleTitle constant so get all allowed values
+_ROLE_TITLES: FrozenSet[str] = frozenset(get_all_class_attr_values(RoleTitle))
+
+# Role.title set by sanitize_roles().
+# interned so that titles sanitize_roles() itself just set can be compared with "is"
+_COUNCILMEMBER = sys.intern(RoleTitle.COUNCILMEMBER)
+_COUNCILPRESIDENT = sys.intern(RoleTitle.COUNCILPRESIDENT)
+_MEMBER = sys.intern(RoleTitle.MEMBER)
+_CHAIR = sys.intern(RoleTitle.CHAIR)
+_VICE_CHAIR = sys.intern(RoleTitle.VICE_CHAIR)
+_ALTERNATE = sys.intern(RoleTitle.ALTERNATE)
+_SUPERVISOR = sys.intern(RoleTitle.SUPERVISOR)
+
+# sanitize_roles() primary bodies if not given in static data.
+# these are reasonably good defaults for most municipalities.
+_DEFAULT_PRIMARY_BODIES: FrozenSet[str] = frozenset(
+    ["city council", "council briefing"]
+)
+
+# printable ascii and whitespace that ftfy would leave as-is.
+# excludes & and \ for html entities like &amp; and escapes like \u00e9
+_NO_UNICODE_FIX_RE = re.compile(r"[\x20-\x25\x27-\x5b\x5d-\x7e\t\n\f]*")
 
-def reduced_list(input_list: List[Any], collapse: bool = True) -> Optional[List]:
+
+def reduced_list(input_list: Iterable[Any], collapse: bool = True) -> Optional[List]:
     """
     Remove all None items from input_list.
 
     Parameters
     ----------
-    input_list: List[Any]
-        Input list from which to filter out items that are None
+    input_list: Iterable[Any]
+        Input list or iterator from which to filter out items that are None
     collapse: bool, default = True
         If True, return None in place of an empty list
 
@@ -44,12 +88,15 @@ def reduced_list(input_list: List[Any], collapse: bool = True) -> Optional[List]
     reduced_list: Optional[List]
         All items in the original list except for None values.
         None if all items were None and collapse is True.
+        input_list itself, not a copy, if it is a list without None items.
     """
-    filtered = [item for item in input_list if item is not None]
-    if collapse and len(filtered) == 0:
-        filtered = None
+    if isinstance(input_list, list) and None not in input_list:
+        # nothing to remove; skip copying the list.
+        # not for iterators; "in" would consume them
+        return input_list if input_list or not collapse else None
 
-    return filtered
+    filtered = [item for item in input_list if item is not None]
+    return filtered or (None if collapse else filtered)
 
 
 def str_simplified(input_str: str) -> str:
@@ -68,15 +115,52 @@ def str_simplified(input_str: str) -> str:
     """
     if not isinstance(input_str, str):
         return input_str
+    return _str_simplified_cached(input_str)
 
-    input_str = cleantext.clean(
-        input_str, fix_unicode=True, lower=False, to_ascii=False
-    )
 
-    # Replace utf-8 char encodings with single utf-8 chars themselves
-    input_str = input_str.encode("utf-8").decode("utf-8")
+@functools.lru_cache(maxsize=4096)
+def _str_simplified_cached(input_str: str) -> str:
+    """
+    str_simplified() for a str.
+    The same body names, titles are simplified many times in a scrape.
+    """
+    if not _NO_UNICODE_FIX_RE.fullmatch(input_str):
+        # e.g. mojibake, html entities, "e" + combining acute accent -> "é"
+        try:
+            # literal escapes like \u00e9 -> é
+            input_str = input_str.encode("latin", "backslashreplace").decode(
+                "unicode-escape"
+            )
+        except UnicodeDecodeError:
+            pass
+        input_str = ftfy.fix_text(input_str, normalization="NFC")
 
-    return input_str
+    # strip each line, collapse whitespaces within each line,
+    # drop empty lines
+    lines = (" ".join(line.split()) for line in input_str.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _tz_aware(dt: datetime) -> datetime:
+    """
+    dt as-is if it has time zone info, else naive local time dt in UTC.
+    Time zone aware datetimes compare correctly without conversion.
+    """
+    return dt if dt.tzinfo is not None else dt.astimezone(timezone.utc)
+
+
+def _trim_overlaps(sorted_roles: List[Role]) -> None:
+    """
+    If a role overlaps with the next role, end it the day before the next one starts.
+
+    Parameters
+    ----------
+    sorted_roles: List[Role]
+        Roles sorted from old to new by start_datetime. Modified in place.
+    """
+    for prev_role, this_role in zip(sorted_roles, islice(sorted_roles, 1, None)):
+        if prev_role.end_datetime > this_role.start_datetime:
+            prev_role.end_datetime = this_role.start_datetime - timedelta(days=1)
 
 
 def parse_static_person(
@@ -110,7 +194,7 @@ def parse_static_person(
 
     person: Person = Person.from_dict(
         # "seat" and "roles" are not direct serializations of Seat/Role
-        {k: v for k, v in person_json.items() if k != "seat" and k != "roles"}
+        {k: v for k, v in person_json.items() if k not in ("seat", "roles")}
     )
     if "seat" not in person_json:
         log.debug("Seat name not given")
@@ -121,14 +205,14 @@ def parse_static_person(
         log.error(f"{seat_name} is not defined in top-level 'seats'")
         return person
 
-    # Keep all_seats unmodified; we will append Roles to this person.seat below
-    person.seat = deepcopy(all_seats[seat_name])
+    # Keep all_seats unmodified; we will append Roles to this person.seat below.
+    # Seat fields are all str except roles, so only roles needs its own copy.
+    seat = all_seats[seat_name]
+    person.seat = replace(seat, roles=copy(seat.roles))
     if "roles" not in person_json:
         log.debug("Roles not given")
         return person
 
-    # Role.title must be a RoleTitle constant so get all allowed values
-    role_titles: List[str] = get_all_class_attr_values(RoleTitle)
     for role_json in person_json["roles"]:
         if (
             # if str, it is looked-up in primary_bodies
@@ -139,7 +223,7 @@ def parse_static_person(
                 f"{role_json} is ignored. "
                 f"{role_json['body']} is not defined in top-level 'primary_bodies'"
             )
-        elif role_json["title"] not in role_titles:
+        elif role_json["title"] not in _ROLE_TITLES:
             log.error(
                 f"{role_json} is ignored. "
                 f"{role_json['title']} is not a RoleTitle constant."
@@ -187,42 +271,30 @@ def parse_static_file(file_path: Path) -> ScraperStaticData:
     -----
     Function looks for "seats", "primary_bodies", "persons" top-level keys
     """
-    with open(file_path) as static_file:
-        static_json: Dict[str, Dict[str, Any]] = json.load(static_file)
-
-        if "seats" not in static_json:
-            seats: Dict[str, Seat] = {}
-        else:
-            seats: Dict[str, Seat] = {
-                seat_name: Seat.from_dict(seat)
-                for seat_name, seat in static_json["seats"].items()
-            }
-
-        if "primary_bodies" not in static_json:
-            primary_bodies: Dict[str, Body] = {}
-        else:
-            primary_bodies: Dict[str, Body] = {
-                body_name: Body.from_dict(body)
-                for body_name, body in static_json["primary_bodies"].items()
-            }
-
-        if "persons" not in static_json:
-            known_persons: Dict[str, Person] = {}
-        else:
-            known_persons: Dict[str, Person] = {
-                person_name: parse_static_person(person, seats, primary_bodies)
-                for person_name, person in static_json["persons"].items()
-            }
-
-        log.debug(
-            f"ScraperStaticData parsed from {file_path}:\n"
-            f"    seats: {list(seats.keys())}\n"
-            f"    primary_bodies: {list(primary_bodies.keys())}\n"
-            f"    persons: {list(known_persons.keys())}\n"
-        )
-        return ScraperStaticData(
-            seats=seats, primary_bodies=primary_bodies, persons=known_persons
-        )
+    static_json: Dict[str, Dict[str, Any]] = json_loads(Path(file_path).read_bytes())
+
+    seats: Dict[str, Seat] = {
+        seat_name: Seat.from_dict(seat)
+        for seat_name, seat in static_json.get("seats", {}).items()
+    }
+    primary_bodies: Dict[str, Body] = {
+        body_name: Body.from_dict(body)
+        for body_name, body in static_json.get("primary_bodies", {}).items()
+    }
+    known_persons: Dict[str, Person] = {
+        person_name: parse_static_person(person, seats, primary_bodies)
+        for person_name, person in static_json.get("persons", {}).items()
+    }
+
+    log.debug(
+        f"ScraperStaticData parsed from {file_path}:\n"
+        f"    seats: {list(seats.keys())}\n"
+        f"    primary_bodies: {list(primary_bodies.keys())}\n"
+        f"    persons: {list(known_persons.keys())}\n"
+    )
+    return ScraperStaticData(
+        seats=seats, primary_bodies=primary_bodies, persons=known_persons
+    )
 
 
 def sanitize_roles(
@@ -249,10 +321,12 @@ def sanitize_roles(
         See Notes.
 
     council_pres_patterns: List[str]
-        Set roles[i].title as "Council President" if match
+        Set roles[i].title as "Council President" if any is a substring
+        of roles[i].title, ignoring case,
         and roles[i].body is a primary body like City Council
     chair_patterns: List[str]
-        Set roles[i].title as "Chair" if match
+        Set roles[i].title as "Chair" if any is a substring
+        of roles[i].title, ignoring case,
         and roles[i].body is not a primary body
 
     Notes
@@ -271,17 +345,35 @@ def sanitize_roles(
 
     if not static_data or not static_data.primary_bodies:
         # Primary/full council not defined in static data file.
-        # these are reasonably good defaults for most municipalities.
-        primary_body_names = ["city council", "council briefing"]
+        primary_body_names = _DEFAULT_PRIMARY_BODIES
     else:
-        primary_body_names = [
+        primary_body_names = frozenset(
             body_name.lower() for body_name in static_data.primary_bodies.keys()
-        ]
+        )
 
-    try:
-        have_primary_roles = len(static_data.persons[person_name].seat.roles) > 0
-    except (KeyError, AttributeError, TypeError):
-        have_primary_roles = False
+    # the patterns are plain substrings; no need for regex
+    council_pres_patterns = tuple(pattern.lower() for pattern in council_pres_patterns)
+    chair_patterns = tuple(pattern.lower() for pattern in chair_patterns)
+
+    # simplify each role's title just once
+    title_lc: Dict[int, str] = {
+        id(role): str_simplified(role.title).lower() if role.title else ""
+        for role in roles
+    }
+
+    # roles for this person given in static data, if any
+    static_person = (getattr(static_data, "persons", None) or {}).get(person_name)
+    static_roles: List[Role] = (
+        getattr(getattr(static_person, "seat", None), "roles", None) or []
+    )
+    have_primary_roles = len(static_roles) > 0
+
+    now_utc = datetime.now(timezone.utc)
+    # (start_datetime, end_datetime) of each role given in static data
+    static_ranges: Tuple[Tuple[datetime, datetime], ...] = tuple(
+        (static_role.start_datetime, static_role.end_datetime)
+        for static_role in static_roles
+    )
 
     def _is_role_period_ok(role: Role) -> bool:
         """
@@ -291,19 +383,14 @@ def sanitize_roles(
             return False
         if not have_primary_roles:
             # no roles in static data; accept if this this role is current
-            return role.start_datetime.astimezone(
-                pytz.utc
-            ) <= datetime.today().astimezone(pytz.utc) and datetime.today().astimezone(
-                pytz.utc
-            ) <= role.end_datetime.astimezone(
-                pytz.utc
+            return (
+                _tz_aware(role.start_datetime)
+                <= now_utc
+                <= _tz_aware(role.end_datetime)
             )
         # accept if role coincides with one given in static data
-        for static_role in static_data.persons[person_name].seat.roles:
-            if (
-                static_role.start_datetime <= role.start_datetime
-                and role.end_datetime <= static_role.end_datetime
-            ):
+        for static_start, static_end in static_ranges:
+            if static_start <= role.start_datetime and role.end_datetime <= static_end:
                 return True
         return False
 
@@ -311,67 +398,39 @@ def sanitize_roles(
         """
         Is role.body one of primary_bodies in static data file
         """
-        return (
-            role.body is not None
-            and role.body.name is not None
-            and str_simplified(role.body.name).lower() in primary_body_names
-        )
+        if role.body is None or not role.body.name:
+            return False
+        return str_simplified(role.body.name).lower() in primary_body_names
 
     def _fix_primary_title(role: Role) -> str:
         """
         Council president or Councilmember
         """
-        if (
-            role.title is None
-            or re.search(
-                "|".join(council_pres_patterns), str_simplified(role.title), re.I
-            )
-            is None
-        ):
-            return RoleTitle.COUNCILMEMBER
-        return RoleTitle.COUNCILPRESIDENT
+        if any(pattern in title_lc[id(role)] for pattern in council_pres_patterns):
+            return _COUNCILPRESIDENT
+        return _COUNCILMEMBER
 
     def _fix_nonprimary_title(role: Role) -> str:
         """
         Not council president or councilmember
         """
-        if role.title is None:
-            return RoleTitle.MEMBER
-
-        role_title = str_simplified(role.title).lower()
+        role_title = title_lc[id(role)]
         # Role is not for a primary/full council
         # Role.title cannot be Councilmember or Council President
         if "vice" in role_title:
-            return RoleTitle.VICE_CHAIR
+            return _VICE_CHAIR
         if "alt" in role_title:
-            return RoleTitle.ALTERNATE
+            return _ALTERNATE
         if "super" in role_title:
-            return RoleTitle.SUPERVISOR
-        if re.search("|".join(chair_patterns), role_title, re.I) is not None:
-            return RoleTitle.CHAIR
-        return RoleTitle.MEMBER
+            return _SUPERVISOR
+        if any(pattern in role_title for pattern in chair_patterns):
+            return _CHAIR
+        return _MEMBER
 
     def _is_councilmember_term(role: Role) -> bool:
-        return (
-            role.title == RoleTitle.COUNCILMEMBER
-            and role.start_datetime is not None
-            and role.end_datetime is not None
-        )
-
-    roles = list(
-        # drop dynamically scraped primary roles
-        # if primary roles are given in static data
-        filterfalse(
-            lambda role: have_primary_roles and _is_primary_body(role),
-            # filter out bad start_datetime, end_datetime
-            filter(_is_role_period_ok, roles),
-        )
-    )
-    # standardize titles
-    for role in filter(_is_primary_body, roles):
-        role.title = _fix_primary_title(role)
-    for role in filterfalse(_is_primary_body, roles):
-        role.title = _fix_nonprimary_title(role)
+        # role.[start | end]_datetime are not None per _is_role_period_ok().
+        # only for role.title just set by _fix_[primary | nonprimary]_title()
+        return role.title is _COUNCILMEMBER
 
     class CouncilMemberTerm(NamedTuple):
         start_datetime: datetime
@@ -381,46 +440,53 @@ def sanitize_roles(
     # when checking for overlapping terms, we should do so per body.
     # e.g. simultaneous councilmember roles in city council and in council briefing
     # are completely acceptable and common.
+    member_roles_by_body: DefaultDict[str, List[Role]] = defaultdict(list)
+
+    # filter, standardize titles and group councilmember terms in one pass
+    sanitized_roles: List[Role] = []
+    for role in roles:
+        # filter out bad start_datetime, end_datetime
+        if not _is_role_period_ok(role):
+            continue
+
+        is_primary = _is_primary_body(role)
+        if have_primary_roles and is_primary:
+            # drop dynamically scraped primary roles
+            # if primary roles are given in static data
+            continue
+
+        # standardize titles
+        if is_primary:
+            role.title = _fix_primary_title(role)
+        else:
+            role.title = _fix_nonprimary_title(role)
+        sanitized_roles.append(role)
+
+        # get all dynamically scraped councilmember terms
+        if not have_primary_roles and _is_councilmember_term(role):
+            member_roles_by_body[role.body.name].append(role)
+    roles = sanitized_roles
 
     scraped_member_roles_by_body: List[List[Role]] = [
-        list(roles_for_body)
-        for body_name, roles_for_body in groupby(
-            sorted(
-                filter(
-                    # get all dynamically scraped councilmember terms
-                    lambda role: not have_primary_roles
-                    and _is_councilmember_term(role),
-                    roles,
-                ),
-                # sort from old to new role
-                key=lambda role: (
-                    role.body.name,
-                    role.start_datetime,
-                    role.end_datetime,
-                ),
-            ),
-            # group by body
-            key=lambda role: role.body.name,
+        # sort from old to new role
+        sorted(
+            roles_for_body,
+            key=attrgetter("start_datetime", "end_datetime"),
         )
+        for roles_for_body in member_roles_by_body.values()
     ]
 
     if have_primary_roles:
         # don't forget to include info from the static data file
-        roles.extend(static_data.persons[person_name].seat.roles)
+        roles.extend(static_roles)
     if len(scraped_member_roles_by_body) == 0:
         # no Councilmember roles dynamically scraped
         # nothing more to do
         return roles
 
     for roles_for_body in scraped_member_roles_by_body:
-        for i in [i for i, role in enumerate(roles_for_body) if i > 0]:
-            prev_role = roles_for_body[i - 1]
-            this_role = roles_for_body[i]
-            # if member role i overlaps with member role j, end i before j
-            if prev_role.end_datetime > this_role.start_datetime:
-                roles[
-                    roles.index(prev_role)
-                ].end_datetime = this_role.start_datetime - timedelta(days=1)
+        # these are the same Role objects that are in roles
+        _trim_overlaps(roles_for_body)
 
     return roles
 
@@ -0,0 +1,303 @@
+import asyncio
+import json
+import re
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Lock, Thread
+from typing import Any, Dict, Iterator, List
+from urllib.error import URLError
+
+import pytest
+import requests
+
+from cdp_scrapers import legistar_utils
+
+
+class _UnavailableHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def unavailable_server() -> Iterator[str]:
+    server = HTTPServer(("127.0.0.1", 0), _UnavailableHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_legistar_body_unavailable(
+    unavailable_server: str, monkeypatch: pytest.MonkeyPatch
+):
+    # legistar keeps responding 503 even after retries
+    monkeypatch.setattr(
+        legistar_utils, "LEGISTAR_BODY_BASE", unavailable_server + "/{client}/Bodies"
+    )
+    assert legistar_utils.get_legistar_body(client="x", body_id=1) is None
+
+
+class _FakeResponse:
+    def __init__(self, data: Any, status_code: int = 200):
+        self.status_code = status_code
+        self.content = json.dumps(data).encode()
+
+
+class _FakeLegistar:
+    """
+    legistar_session stand-in with 2 events sharing one voting person.
+    batching: whether $expand and batched $filter queries are supported
+    """
+
+    def __init__(self, batching: bool, fail_votes: bool = False):
+        self.batching = batching
+        self.fail_votes = fail_votes
+        self.urls: List[str] = []
+        self.lock = Lock()
+
+    @staticmethod
+    def items(event_id: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "EventItemId": event_id * 10 + 1,
+                # second event's item has no matter
+                "EventItemMatterId": 110 if event_id == 1 else None,
+                "EventItemMatterAttachments": [],
+            }
+        ]
+
+    def get(self, url: str, **kwargs: Any) -> _FakeResponse:
+        with self.lock:
+            self.urls.append(url)
+
+        rejected = _FakeResponse({"Message": "not supported"}, 400)
+        if "/Events?" in url:
+            events = [
+                {"EventId": 1, "EventBodyId": 10},
+                {"EventId": 2, "EventBodyId": 10},
+            ]
+            if "$expand" not in url:
+                return _FakeResponse(events)
+            if not self.batching:
+                return rejected
+            return _FakeResponse(
+                [
+                    dict(event, EventItems=self.items(event["EventId"]))
+                    for event in events
+                ]
+            )
+        if "/Matters?" in url or "/Persons?" in url:
+            if not self.batching:
+                return rejected
+            if "/Matters?" in url:
+                return _FakeResponse(
+                    [
+                        {
+                            "MatterId": 110,
+                            "MatterSponsors": [{"MatterSponsorNameId": 101}],
+                        }
+                    ]
+                )
+            ids = [int(i) for i in re.findall(r"PersonId\+eq\+(\d+)", url)]
+            return _FakeResponse([{"PersonId": person_id} for person_id in ids])
+
+        match = re.search(r"/Events/(\d+)/EventItems", url)
+        if match:
+            return _FakeResponse(self.items(int(match.group(1))))
+        if re.search(r"/EventItems/\d+/Votes", url):
+            if self.fail_votes:
+                raise requests.exceptions.ConnectionError(url)
+            return _FakeResponse([{"VotePersonId": 100}])
+        if url.endswith("/Matters/110/Sponsors"):
+            return _FakeResponse([{"MatterSponsorNameId": 101}])
+        if url.endswith("/OfficeRecords"):
+            return _FakeResponse([{"OfficeRecordBodyId": 10}])
+        match = re.search(r"/Persons/(\d+)$", url)
+        if match:
+            return _FakeResponse({"PersonId": int(match.group(1))})
+        match = re.search(r"/Bodies/(\d+)$", url)
+        if match:
+            return _FakeResponse({"BodyId": int(match.group(1))})
+        raise ValueError(url)
+
+
+def _expected_events() -> List[Dict[str, Any]]:
+    body = {"BodyId": 10}
+
+    def person(person_id: int) -> Dict[str, Any]:
+        return {
+            "PersonId": person_id,
+            "OfficeRecordInfo": [
+                {"OfficeRecordBodyId": 10, "OfficeRecordBodyInfo": body}
+            ],
+        }
+
+    return [
+        {
+            "EventId": 1,
+            "EventBodyId": 10,
+            "EventBodyInfo": body,
+            "EventItems": [
+                {
+                    "EventItemId": 11,
+                    "EventItemMatterId": 110,
+                    "EventItemMatterAttachments": [],
+                    "EventItemVoteInfo": [
+                        {"VotePersonId": 100, "PersonInfo": person(100)}
+                    ],
+                    "MatterSponsorInfo": [
+                        {"MatterSponsorNameId": 101, "SponsorPersonInfo": person(101)}
+                    ],
+                }
+            ],
+        },
+        {
+            "EventId": 2,
+            "EventBodyId": 10,
+            "EventBodyInfo": body,
+            "EventItems": [
+                {
+                    "EventItemId": 21,
+                    "EventItemMatterId": None,
+                    "EventItemMatterAttachments": [],
+                    "EventItemVoteInfo": [
+                        {"VotePersonId": 100, "PersonInfo": person(100)}
+                    ],
+                    "MatterSponsorInfo": None,
+                }
+            ],
+        },
+    ]
+
+
+def _use_fake_legistar(monkeypatch: pytest.MonkeyPatch, fake: Any) -> None:
+    monkeypatch.setattr(legistar_utils, "legistar_session", fake)
+    monkeypatch.setattr(legistar_utils, "unsupported_legistar_queries", set())
+
+
+@pytest.mark.parametrize("batching", [True, False])
+def test_get_legistar_events_for_timespan(
+    batching: bool, monkeypatch: pytest.MonkeyPatch
+):
+    fake = _FakeLegistar(batching=batching)
+    _use_fake_legistar(monkeypatch, fake)
+
+    events = legistar_utils.get_legistar_events_for_timespan(
+        "x", datetime(2022, 1, 1), datetime(2022, 1, 2)
+    )
+    assert events == _expected_events()
+
+    # person 100 votes in both events but is queried only once
+    assert sum(url.endswith("/Persons/100/OfficeRecords") for url in fake.urls) == 1
+    assert sum(url.endswith("/Persons/100") for url in fake.urls) == (
+        0 if batching else 1
+    )
+
+
+def test_get_legistar_events_for_timespan_error(monkeypatch: pytest.MonkeyPatch):
+    _use_fake_legistar(monkeypatch, _FakeLegistar(batching=False, fail_votes=True))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        legistar_utils.get_legistar_events_for_timespan(
+            "x", datetime(2022, 1, 1), datetime(2022, 1, 2)
+        )
+
+
+_MEETING_PAGE = (
+    b'<html><body><a id="ctl00_ContentPlaceHolder1_hypVideo" class="videolink" '
+    b"onclick=\"window.open('Video.aspx?ID1=1','video');return false;\" "
+    b'href="#">Video</a></body></html>'
+)
+_MEETING_EVENT = {
+    "EventVideoPath": None,
+    "EventInSiteURL": "https://x.legistar.com/MeetingDetail.aspx?ID=1",
+}
+
+
+def _refuse_video_connection(*args: Any) -> None:
+    # e.g. a content parser's own urlopen() failing
+    raise URLError("connection refused")
+
+
+def test_get_legistar_content_uris_url_error(monkeypatch: pytest.MonkeyPatch):
+    class _FakeSession:
+        def get(self, url: str, **kwargs: Any) -> _FakeResponse:
+            response = _FakeResponse(None)
+            response.content = _MEETING_PAGE
+            response.raise_for_status = lambda: None
+            return response
+
+    monkeypatch.setattr(legistar_utils, "legistar_session", _FakeSession())
+    monkeypatch.setattr(legistar_utils, "_parse_video_page", _refuse_video_connection)
+
+    assert legistar_utils.get_legistar_content_uris("x", _MEETING_EVENT) == (
+        legistar_utils.ContentUriScrapeResult.Status.ResourceAccessError,
+        None,
+    )
+
+
+def test_get_legistar_content_uris_async_url_error(monkeypatch: pytest.MonkeyPatch):
+    # pip install cdp-scrapers[async]
+    pytest.importorskip("aiohttp")
+
+    class _FakeAsyncResponse:
+        async def __aenter__(self) -> "_FakeAsyncResponse":
+            return self
+
+        async def __aexit__(self, *args: Any) -> None:
+            pass
+
+        def raise_for_status(self) -> None:
+            pass
+
+        async def read(self) -> bytes:
+            return _MEETING_PAGE
+
+    class _FakeAsyncSession:
+        def get(self, url: str, **kwargs: Any) -> _FakeAsyncResponse:
+            return _FakeAsyncResponse()
+
+    monkeypatch.setattr(legistar_utils, "_parse_video_page", _refuse_video_connection)
+
+    assert asyncio.run(
+        legistar_utils.get_legistar_content_uris_async(
+            _FakeAsyncSession(), "x", _MEETING_EVENT
+        )
+    ) == (legistar_utils.ContentUriScrapeResult.Status.ResourceAccessError, None)
+
+
+@pytest.mark.parametrize(
+    "status_code, is_unsupported",
+    [(400, True), (501, True), (200, True), (429, False), (503, False)],
+)
+def test_get_legistar_list_rejected(
+    status_code: int, is_unsupported: bool, monkeypatch: pytest.MonkeyPatch
+):
+    class _FakeSession:
+        def get(self, url: str, **kwargs: Any) -> _FakeResponse:
+            # 200 without a list is a rejection too
+            return _FakeResponse({"Message": "no"}, status_code)
+
+    _use_fake_legistar(monkeypatch, _FakeSession())
+
+    assert legistar_utils._get_legistar_list("x", "Persons?$filter", "url") is None
+    assert (
+        ("x", "Persons?$filter") in legistar_utils.unsupported_legistar_queries
+    ) == is_unsupported
+
+
+def test_get_legistar_list_connection_error(monkeypatch: pytest.MonkeyPatch):
+    class _FakeSession:
+        def get(self, url: str, **kwargs: Any) -> _FakeResponse:
+            raise requests.exceptions.ConnectionError(url)
+
+    _use_fake_legistar(monkeypatch, _FakeSession())
+
+    assert legistar_utils._get_legistar_list("x", "Persons?$filter", "url") is None
+    assert not legistar_utils.unsupported_legistar_queries
@@ -1,6 +1,12 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
+
 import pytest
+from cdp_backend.database.constants import RoleTitle
+from cdp_backend.pipeline.ingestion_models import Body, Person, Role, Seat
 
-from cdp_scrapers.scraper_utils import str_simplified
+from cdp_scrapers.scraper_utils import reduced_list, sanitize_roles, str_simplified
+from cdp_scrapers.types import ScraperStaticData
 
 
 @pytest.mark.parametrize(
@@ -15,9 +21,142 @@ from cdp_scrapers.scraper_utils import str_simplified
         ("test\r\n\ftest", "test\ntest"),
         ("test \t\vtest", "test test"),
         ("M. Lorena Gonz\u00e1lez", "M. Lorena González"),
+        ("M. Lorena Gonza\u0301lez", "M. Lorena González"),
+        # html entity
+        ("a &amp; b", "a & b"),
+        # literal escape sequence
+        ("Caf\\u00e9", "Café"),
+        # mojibake
+        ("GonzÃ¡lez", "González"),
+        ("test\rtest", "test\ntest"),
         (5, 5),
     ],
 )
 def test_str_simplifed(input_string: str, expected_output: str):
     # Validate that both methods work the same
     assert str_simplified(input_string) == expected_output
+
+
+@pytest.mark.parametrize(
+    "input_list, collapse, expected_output",
+    [
+        ([1, None, 2], True, [1, 2]),
+        ([1, 2], True, [1, 2]),
+        ([None, None], True, None),
+        ([None, None], False, []),
+        ([], True, None),
+        ([], False, []),
+        ([0, "", None], True, [0, ""]),
+        (iter([1, 2]), True, [1, 2]),
+        (map(lambda i: i, [1, None, 2]), False, [1, 2]),
+        (iter([]), True, None),
+    ],
+)
+def test_reduced_list(
+    input_list: List[Any], collapse: bool, expected_output: Optional[List]
+):
+    assert reduced_list(input_list, collapse=collapse) == expected_output
+
+
+def _role(
+    title: Optional[str],
+    body_name: str,
+    start_datetime: Optional[datetime],
+    end_datetime: Optional[datetime],
+) -> Role:
+    return Role(
+        title=title,
+        body=Body(name=body_name),
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+    )
+
+
+def test_sanitize_roles():
+    now = datetime.now(timezone.utc)
+    council_term = _role(
+        "Councilmember", "City Council", now - timedelta(800), now + timedelta(100)
+    )
+    # overlaps with council_term
+    next_council_term = _role(
+        "Councilmember", "City Council", now - timedelta(10), now + timedelta(800)
+    )
+    # simultaneous councilmember role in another primary body is fine
+    briefing_term = _role(
+        "Councilmember", "Council Briefing", now - timedelta(500), now + timedelta(500)
+    )
+    roles = [
+        next_council_term,
+        council_term,
+        briefing_term,
+        _role("Council President", "city council", now, now + timedelta(1)),
+        _role("Vice Chair", "Finance", now - timedelta(1), now + timedelta(1)),
+        _role("Alternate", "Finance", now - timedelta(1), now + timedelta(1)),
+        _role("President", "Finance", now - timedelta(1), now + timedelta(1)),
+        _role(None, "Finance", now - timedelta(1), now + timedelta(1)),
+        # missing, past datetimes
+        _role("Chair", "Finance", None, now + timedelta(1)),
+        _role("Chair", "Finance", now - timedelta(1), None),
+        _role("Chair", "Finance", now - timedelta(10), now - timedelta(1)),
+    ]
+
+    roles = sanitize_roles("Jane Doe", roles)
+    assert [role.title for role in roles] == [
+        RoleTitle.COUNCILMEMBER,
+        RoleTitle.COUNCILMEMBER,
+        RoleTitle.COUNCILMEMBER,
+        RoleTitle.COUNCILPRESIDENT,
+        RoleTitle.VICE_CHAIR,
+        RoleTitle.ALTERNATE,
+        RoleTitle.CHAIR,
+        RoleTitle.MEMBER,
+    ]
+    # overlapping terms in the same body are trimmed
+    assert council_term.end_datetime == next_council_term.start_datetime - timedelta(
+        days=1
+    )
+    assert next_council_term.end_datetime == now + timedelta(800)
+    assert briefing_term.end_datetime == now + timedelta(500)
+
+    assert sanitize_roles("Jane Doe", None) == []
+
+
+def test_sanitize_roles_static_data():
+    start_datetime = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end_datetime = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    static_role = _role(
+        RoleTitle.COUNCILMEMBER, "Full Council", start_datetime, end_datetime
+    )
+    static_data = ScraperStaticData(
+        seats={},
+        primary_bodies={"Full Council": Body(name="Full Council")},
+        persons={
+            "Jane Doe": Person(
+                name="Jane Doe", seat=Seat(name="Seat 1", roles=[static_role])
+            )
+        },
+    )
+    finance_role = _role(
+        "chair", "Finance", datetime(2021, 1, 1, tzinfo=timezone.utc), end_datetime
+    )
+    roles = [
+        # replaced by the static role
+        _role(
+            "Councilmember",
+            "Full Council",
+            datetime(2021, 1, 1, tzinfo=timezone.utc),
+            datetime(2022, 1, 1, tzinfo=timezone.utc),
+        ),
+        finance_role,
+        # not within the static role
+        _role(
+            "Chair",
+            "Finance",
+            datetime(2019, 1, 1, tzinfo=timezone.utc),
+            datetime(2021, 1, 1, tzinfo=timezone.utc),
+        ),
+    ]
+
+    roles = sanitize_roles("Jane Doe", roles, static_data)
+    assert roles == [finance_role, static_role]
+    assert finance_role.title == RoleTitle.CHAIR
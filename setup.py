@@ -13,6 +13,18 @@ atlanta_reqs = [
     "webdriver-manager~=3.8",
 ]
 
+async_reqs = [
+    "aiohttp~=3.8",
+]
+
+cache_reqs = [
+    "requests-cache~=0.9",
+]
+
+speedups_reqs = [
+    "orjson~=3.6",
+]
+
 test_requirements = [
     *atlanta_reqs,
     "black>=19.10b0",
@@ -40,14 +52,18 @@ requirements = [
     "beautifulsoup4~=4.9",
     "cdp-backend~=3.0",
     "defusedxml~=0.7.1",
+    "lxml>=4.9",
     "pytz~=2021.1",
     "requests~=2.25",
-    "clean-text~=0.6.0",
+    "ftfy~=6.0",
     "civic-scraper~=0.2.5",
 ]
 
 extra_requirements = {
+    "async": async_reqs,
     "atlanta": atlanta_reqs,
+    "cache": cache_reqs,
+    "speedups": speedups_reqs,
     "test": test_requirements,
     "dev": dev_requirements,
     "all": [